@@ -1,4 +1,5 @@
 """drover: a command-line utility to deploy Python packages to Lambda functions"""
+import functools
 import logging
 import os
 import re
@@ -7,12 +8,10 @@ import sys
 import tempfile
 import zipfile
 from http import HTTPStatus
-from io import StringIO
 from pathlib import Path
 from typing import Any, BinaryIO, Callable, Iterable, List, Mapping, Optional, Pattern, Sequence
 
-import boto3
-import botocore
+import botocore.exceptions
 import tqdm
 from pydantic import BaseModel
 
@@ -21,6 +20,7 @@ from drover.io import (
     FunctionLayerMappings,
     format_file_size,
     get_digest,
+    get_pattern_matcher,
     get_relative_file_names,
     write_archive,
 )
@@ -28,6 +28,14 @@ from drover.models import S3BucketFileVersion, S3BucketPath, Settings, Stage
 
 _logger = logging.getLogger(__name__)
 
+_PYTHON_RUNTIME_PATTERN = re.compile(r'^python\d+\.\d+$')
+
+
+def _boto3():
+    """Return the `boto3` module, imported on first use as it dominates CLI start-up time"""
+    import boto3
+    return boto3
+
 
 class SettingsError(RuntimeError):
     """Base settings error"""
@@ -49,17 +57,17 @@ class Drover:
 
         self.stage = self.settings.stages[stage]
         self.compatible_runtime_library_path = Drover._get_runtime_library_path(self.stage.compatible_runtime)
-        self.lambda_client = boto3.client('lambda', region_name=self.stage.region_name)
+        self.lambda_client = _boto3().client('lambda', region_name=self.stage.region_name)
 
     def _get_function_layer_mappings(self, install_path: Path) -> FunctionLayerMappings:
         requirements_base_path = self.compatible_runtime_library_path
-        function_file_patterns = self.stage.function_file_patterns
+        is_function_file = get_pattern_matcher(self.stage.function_file_patterns)
 
         requirements_mappings: List[ArchiveMapping] = []
         function_mappings: List[ArchiveMapping] = []
         for relative_file_name in get_relative_file_names(install_path, self.stage.package_exclude_patterns):
             source_file_name = install_path / relative_file_name
-            if any([pattern.match(str(relative_file_name)) for pattern in function_file_patterns]):
+            if is_function_file(str(relative_file_name)):
                 function_mappings.append(
                     ArchiveMapping(
                         source_file_name=source_file_name,
@@ -82,13 +90,12 @@ class Drover:
 
         if _logger.isEnabledFor(logging.DEBUG):
             def _log(header: str, mappings: Sequence[ArchiveMapping]):
-                with StringIO() as message:
-                    message.write(header)
-                    for mapping in sorted(mappings, key=lambda item: item.archive_file_name):
-                        message.write(f'  {mapping.archive_file_name}: {mapping.source_file_name}\n')
-                    _logger.debug(message.getvalue())
-            _log('Requirements file mappings:\n', requirements_mappings)
-            _log('Function file mappings:\n', function_mappings)
+                lines = [header]
+                lines.extend(f'  {mapping.archive_file_name}: {mapping.source_file_name}'
+                             for mapping in sorted(mappings, key=lambda item: item.archive_file_name))
+                _logger.debug('\n'.join(lines))
+            _log('Requirements file mappings:', requirements_mappings)
+            _log('Function file mappings:', function_mappings)
 
         _logger.info('Requirements digest: %s', requirements_digest)
         _logger.info('Function digest: %s', function_digest)
@@ -179,7 +186,7 @@ class Drover:
 
     def _upload_file_to_bucket(self, file_name: Path) -> S3BucketFileVersion:
         upload_bucket: S3BucketPath = self.stage.upload_bucket
-        s3_client = boto3.client('s3', region_name=upload_bucket.region_name)
+        s3_client = _boto3().client('s3', region_name=upload_bucket.region_name)
         file_size = float(file_name.stat().st_size)
         key = f'{upload_bucket.prefix}{file_name.name}'
         with tqdm.tqdm(total=file_size, unit='B', unit_divisor=1024, unit_scale=True, leave=True,
@@ -201,7 +208,7 @@ class Drover:
 
     def _delete_file_from_bucket(self, bucket_file: S3BucketFileVersion):
         upload_bucket = self.stage.upload_bucket
-        s3_client = boto3.client('s3', region_name=upload_bucket.region_name)
+        s3_client = _boto3().client('s3', region_name=upload_bucket.region_name)
         arguments = {
             'Bucket': bucket_file.bucket_name,
             'Key': bucket_file.key,
@@ -230,7 +237,7 @@ class Drover:
                     }
                     if bucket_file.version_id:
                         file_arguments['S3ObjectVersion'] = bucket_file.version_id
-                except (botocore.exceptions.ClientError, boto3.exceptions.S3UploadFailedError) as e:
+                except (botocore.exceptions.ClientError, _boto3().exceptions.S3UploadFailedError) as e:
                     _logger.error('Failed to upload requirements archive to bucket; falling back to direct file upload.')
                     _logger.debug('', exc_info=e)
                     bucket_file = None
@@ -285,7 +292,7 @@ class Drover:
                     }
                     if bucket_file.version_id:
                         file_arguments['S3ObjectVersion'] = bucket_file.version_id
-                except (botocore.exceptions.ClientError, boto3.exceptions.S3UploadFailedError) as e:
+                except (botocore.exceptions.ClientError, _boto3().exceptions.S3UploadFailedError) as e:
                     _logger.error('Failed to upload function archive to bucket; falling back to direct file upload.')
                     _logger.debug('', exc_info=e)
                     bucket_file = None
@@ -320,8 +327,8 @@ class Drover:
             archive_file_name.unlink()
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def _get_runtime_library_path(runtime: str) -> Path:
-        python_pattern = re.compile(r'^python\d+\.\d+$')
-        if python_pattern.match(runtime):
+        if _PYTHON_RUNTIME_PATTERN.match(runtime):
             return Path('python')
         raise NotImplementedError(f'Unsupported runtime: {runtime}')
@@ -11,6 +11,11 @@ from drover import Drover, SettingsError, UpdateError
 from drover.__metadata__ import VERSION
 from drover.models import Settings
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 _logger = logging.getLogger(__name__)
 
 
@@ -35,7 +40,7 @@ def _parse_arguments():
 def _parse_settings(settings_file_name: Path) -> Settings:
     try:
         with open(settings_file_name, 'r') as settings_file:
-            return Settings.parse_obj(yaml.safe_load(settings_file))
+            return Settings.parse_obj(yaml.load(settings_file, Loader=SafeLoader))
     except (ValueError, ValidationError) as e:
         _logger.error('Settings file is invalid: %s', e)
         _logger.debug('', exc_info=e)
@@ -5,14 +5,19 @@ import email.policy
 import hashlib
 import os
 import re
+import shutil
 import zipfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional, Pattern, Sequence
+from typing import Callable, Iterable, NamedTuple, Optional, Pattern, Sequence
 
+# See the PEP-376 RECORD file specification: <https://www.python.org/dev/peps/pep-0376/#record>
+_PACKAGE_RECORD_PATTERN = re.compile(r'\.dist-info/RECORD$')
+_EGG_INFORMATION_PATTERN = re.compile(r'\.egg-info/PKG-INFO$')
+_ARCHIVE_COPY_BUFFER_SIZE = 1 << 20
 
-@dataclass
-class ArchiveMapping:
+
+class ArchiveMapping(NamedTuple):
     """A mapping between an archive file name and its corresponding source filesystem path"""
     source_file_name: Path
     archive_file_name: Path
@@ -54,16 +59,13 @@ def get_digest(source_file_names: Sequence[Path], block_size: int = 8192) -> Opt
         source_file_names: A sequence of source file paths
 
     Returns: A SHA256 hash composed from the content of all source files."""
-    # See the PEP-376 RECORD file specification: <https://www.python.org/dev/peps/pep-0376/#record>
-    package_record_pattern = re.compile(r'\.dist-info/RECORD$')
-    egg_information_pattern = re.compile(r'\.egg-info/PKG-INFO$')
     digest = hashlib.sha256()
     full = set(source_file_names)
     done = set()
     if not full:
         return None
     for source_file_name in sorted(full):
-        if package_record_pattern.search(str(source_file_name)):
+        if _PACKAGE_RECORD_PATTERN.search(str(source_file_name)):
             package_parent_path = source_file_name.parent.parent
             with open(source_file_name, 'r', buffering=block_size) as record:
                 reader = csv.reader(record, delimiter=',', quotechar='"', lineterminator=os.linesep)
@@ -76,7 +78,7 @@ def get_digest(source_file_names: Sequence[Path], block_size: int = 8192) -> Opt
     remaining = full - done
     for source_file_name in sorted(remaining):
         with open(source_file_name, 'rb', buffering=block_size) as source_file:
-            if egg_information_pattern.search(str(source_file_name)):
+            if _EGG_INFORMATION_PATTERN.search(str(source_file_name)):
                 # Ensure deterministic field order from PKG-INFO files
                 # See: https://www.python.org/dev/peps/pep-0314/#including-metadata-in-packages
                 parser = email.parser.BytesHeaderParser(policy=email.policy.default)
@@ -90,6 +92,37 @@ def get_digest(source_file_names: Sequence[Path], block_size: int = 8192) -> Opt
     return digest.hexdigest()
 
 
+def get_pattern_matcher(patterns: Sequence[Pattern]) -> Callable[[str], bool]:
+    """Return a predicate that is true if any of the specified regular expressions match a string
+
+    Where possible, the patterns are fused into a single alternation so each string is scanned once.
+
+    Examples:
+        >>> is_match = get_pattern_matcher([re.compile(r'^a'), re.compile(r'.*c$')])
+        >>> is_match('abc'), is_match('bc'), is_match('b')
+        (True, True, False)
+
+    Args:
+        patterns: a sequence of regular expressions to match from the start of a string
+
+    Returns: a predicate that is true if any of the specified regular expressions match a string"""
+    if not patterns:
+        return lambda _value: False
+    # Numbered group references within a fused pattern only remain valid if no pattern with groups
+    # follows another pattern, so a single pattern with groups is ordered first.
+    patterns = sorted(patterns, key=lambda pattern: pattern.groups, reverse=True)
+    is_fusible = (len({pattern.flags for pattern in patterns}) == 1 and
+                  not any(pattern.groups for pattern in patterns[1:]))
+    if is_fusible:
+        fused_pattern = '|'.join(f'(?:{pattern.pattern})' for pattern in patterns)
+        try:
+            fused = re.compile(fused_pattern, patterns[0].flags)
+            return lambda value: fused.match(value) is not None
+        except re.error:
+            pass
+    return lambda value: any(pattern.match(value) for pattern in patterns)
+
+
 def get_relative_file_names(source_path: Path, exclude_patterns: Sequence[Pattern] = None) -> Iterable[Path]:
     """Return an unsorted iterable of files recursively beneath the source path
 
@@ -98,20 +131,46 @@ def get_relative_file_names(source_path: Path, exclude_patterns: Sequence[Patter
         exclude_patterns: an optional sequence of regular expressions which will be used to exclude files
 
     Returns: an unsorted iterable of files recursively beneath the source path"""
-    exclude_patterns = exclude_patterns or []
-    for root, _directory_names, file_names in os.walk(source_path):
-        for file_name in file_names:
-            relative_file_name = Path(os.path.join(root, file_name)).relative_to(source_path)
-            if not any([pattern.match(str(relative_file_name)) for pattern in exclude_patterns]):
-                yield relative_file_name
-
-
-def write_archive(archive_file_name: Path, archive_mappings: Iterable[ArchiveMapping]) -> None:
+    is_excluded = get_pattern_matcher(exclude_patterns or [])
+    # Walk via `os.scandir` so directory entry types come from the directory listing itself rather
+    # than a `stat` per entry; like `os.walk`, symbolic links to directories are not followed and
+    # paths that cannot be listed (e.g. a missing source path) are skipped.
+    # Relative names are composed as strings; only included files are converted to paths.
+    pending_paths = [(str(source_path), '')]
+    while pending_paths:
+        path, relative_path = pending_paths.pop()
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                relative_file_name = relative_path + entry.name
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        pending_paths.append((entry.path, relative_file_name + os.sep))
+                    continue
+                if not is_excluded(relative_file_name):
+                    yield Path(relative_file_name)
+
+
+def write_archive(archive_file_name: Path, archive_mappings: Iterable[ArchiveMapping],
+                  compresslevel: int = 6) -> None:
     """Write a zip file archive composed of the specified archive file mappings
 
     Args:
         archive_file_name: a writable file
-        archive_mappings: an iterable of mappings of filesystem file names to archive file names"""
-    with zipfile.ZipFile(archive_file_name, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+        archive_mappings: an iterable of mappings of filesystem file names to archive file names
+        compresslevel: a DEFLATE compression level from 0 (no compression) to 9 (best compression)"""
+    with zipfile.ZipFile(archive_file_name, 'w', compression=zipfile.ZIP_DEFLATED,
+                         compresslevel=compresslevel) as archive:
         for mapping in archive_mappings:
-            archive.write(filename=mapping.source_file_name, arcname=mapping.archive_file_name)
+            archive_info = zipfile.ZipInfo.from_file(mapping.source_file_name,
+                                                     arcname=mapping.archive_file_name)
+            archive_info.compress_type = zipfile.ZIP_DEFLATED
+            # `ZipFile.open` does not apply the archive compression level to a given `ZipInfo`;
+            # set it as `ZipFile.write` does.
+            archive_info._compresslevel = compresslevel  # pylint: disable=protected-access
+            with open(mapping.source_file_name, 'rb') as source_file, \
+                 archive.open(archive_info, 'w') as archive_file:
+                shutil.copyfileobj(source_file, archive_file, _ARCHIVE_COPY_BUFFER_SIZE)
@@ -26,7 +26,7 @@ class Stage(BaseModel):
     function_extra_paths: Sequence[Path] = []
     requirements_layer_name: Optional[str]
     supplemental_layer_arns: Sequence[str] = []
-    package_exclude_patterns: Sequence[Pattern] = [re.compile(r'.*__pycache__.*')]
+    package_exclude_patterns: Sequence[Pattern] = [re.compile(r'.*__pycache__', re.ASCII)]
     upload_bucket: Optional[S3BucketPath]
 
     def __init__(self, **kwargs):
@@ -1,4 +1,3 @@
-import codecs
 import re
 import sys
 from pathlib import Path
@@ -10,7 +9,7 @@ import setuptools
 def _read(source_file_name: Path):
     if not source_file_name.is_file():
         raise FileNotFoundError(source_file_name)
-    with codecs.open(str(source_file_name), 'r') as source_file:
+    with open(source_file_name, 'r', encoding='utf-8') as source_file:
         return source_file.read()
 
 
@@ -91,6 +90,10 @@ class ValidateTagCommand(setuptools.Command):
         r'^\s*' + VERSION_PATTERN + r'\s*$',
         re.VERBOSE | re.IGNORECASE,
     )
+    CANONICAL_VERSION_FORMAT = re.compile(
+        r'^([1-9][0-9]*!)?(0|[1-9][0-9]*)(\.(0|[1-9][0-9]*))*((a|b|rc)(0|[1-9][0-9]*))?'
+        r'(\.post(0|[1-9][0-9]*))?(\.dev(0|[1-9][0-9]*))?$'
+    )
 
     def initialize_options(self):
         self.output_azure_variables = False
@@ -124,10 +127,10 @@ class ValidateTagCommand(setuptools.Command):
             )
         )
 
-    @staticmethod
-    def is_canonical(version: str) -> bool:
+    @classmethod
+    def is_canonical(cls, version: str) -> bool:
         """Return true if `version` is canonical per PEP-440."""
-        return re.match(r'^([1-9][0-9]*!)?(0|[1-9][0-9]*)(\.(0|[1-9][0-9]*))*((a|b|rc)(0|[1-9][0-9]*))?(\.post(0|[1-9][0-9]*))?(\.dev(0|[1-9][0-9]*))?$', version) is not None
+        return cls.CANONICAL_VERSION_FORMAT.match(version) is not None
 
 
 setuptools.setup(
@@ -7,10 +7,12 @@ from invoke import call, task
 
 _SOURCE_PATH = 'drover'
 _PROXY_SEPARATOR = '--'
+_PROXY_ARGUMENTS = (' '.join(sys.argv[sys.argv.index(_PROXY_SEPARATOR) + 1:])
+                    if _PROXY_SEPARATOR in sys.argv else None)
 
 def add_proxy_arguments(argument: str) -> Sequence[str]:
-    if _PROXY_SEPARATOR in sys.argv:
-        return f'{argument} {" ".join(sys.argv[sys.argv.index(_PROXY_SEPARATOR) + 1:])}'
+    if _PROXY_ARGUMENTS is not None:
+        return f'{argument} {_PROXY_ARGUMENTS}'
     return argument
 
 
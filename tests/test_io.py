@@ -1,10 +1,19 @@
-import os
+# pylint: disable=protected-access
+import re
+import shutil
+import tempfile
 import zipfile
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, mock_open, MagicMock
 
-from drover.io import ArchiveMapping, get_digest, get_relative_file_names, write_archive
+from drover.io import (
+    ArchiveMapping,
+    get_digest,
+    get_pattern_matcher,
+    get_relative_file_names,
+    write_archive,
+)
 
 
 class TestGetDigest(TestCase):
@@ -12,37 +21,89 @@ class TestGetDigest(TestCase):
         assert get_digest(tuple()) is None
 
 
+class TestGetPatternMatcher(TestCase):
+    def test_without_patterns(self):
+        assert not get_pattern_matcher([])('file_0')
+
+    def test_matches_any_pattern_from_start(self):
+        is_match = get_pattern_matcher([re.compile(r'.*__pycache__.*'), re.compile(r'^function.*')])
+        assert is_match('path_a/__pycache__/file_a_0.pyc')
+        assert is_match('function/file_0')
+        assert not is_match('path_a/function')
+
+    def test_preserves_group_references(self):
+        is_match = get_pattern_matcher([re.compile(r'^a'), re.compile(r'^(b)\1$')])
+        assert is_match('bb')
+        assert not is_match('bc')
+
+    def test_mixed_flags(self):
+        is_match = get_pattern_matcher([re.compile(r'^a', re.IGNORECASE), re.compile(r'^b')])
+        assert is_match('A')
+        assert is_match('b')
+        assert not is_match('B')
+
+
 class TestGetRelativeFileNames(TestCase):
     def test_without_excludes(self):
-        expected_source_path = '/'
-        expected_relative_file_names = set((
+        with tempfile.TemporaryDirectory() as source_path:
+            source_path = Path(source_path)
+            for file_name in ('file_0', 'path_a/file_a_0', 'path_a/file_a_1', 'path_b/file_b_0'):
+                (source_path / file_name).parent.mkdir(exist_ok=True)
+                (source_path / file_name).touch()
+            names = set(get_relative_file_names(source_path))
+        assert names == set((
             Path('file_0'),
             Path('path_a/file_a_0'),
             Path('path_a/file_a_1'),
             Path('path_b/file_b_0')))
-        expected_walk = (
-            ('/', ('path_a', 'path_b',), ('file_0',)),
-            ('/path_a', (), ('file_a_0', 'file_a_1')),
-            ('/path_b', (), ('file_b_0',)),
-        )
-        with patch.object(os, 'walk', return_value=expected_walk) as mock_walk:
-            names = set(get_relative_file_names(expected_source_path))
-            mock_walk.assert_called_once_with(str(expected_source_path))
-            assert names == expected_relative_file_names
+
+    def test_with_excludes(self):
+        with tempfile.TemporaryDirectory() as source_path:
+            source_path = Path(source_path)
+            (source_path / 'path_a' / '__pycache__').mkdir(parents=True)
+            (source_path / 'path_a' / 'file_a_0').touch()
+            (source_path / 'path_a' / '__pycache__' / 'file_a_0.pyc').touch()
+            names = set(get_relative_file_names(source_path, [re.compile(r'.*__pycache__')]))
+        assert names == {Path('path_a/file_a_0')}
+
+    def test_does_not_follow_directory_links(self):
+        with tempfile.TemporaryDirectory() as source_path:
+            source_path = Path(source_path)
+            (source_path / 'path_a').mkdir()
+            (source_path / 'path_a' / 'file_a_0').touch()
+            (source_path / 'file_0').touch()
+            (source_path / 'link_a').symlink_to(source_path / 'path_a', target_is_directory=True)
+            (source_path / 'link_0').symlink_to(source_path / 'file_0')
+            names = set(get_relative_file_names(source_path))
+        assert names == {Path('file_0'), Path('link_0'), Path('path_a/file_a_0')}
+
+    def test_missing_source_path(self):
+        with tempfile.TemporaryDirectory() as source_path:
+            assert not set(get_relative_file_names(Path(source_path) / 'missing'))
+
+
+class _FakeZipFile:
+    def __init__(self):
+        self.open = MagicMock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc_info):
+        pass
 
 
 class TestWriteArchive(TestCase):
     def test_write_empty_archive(self):
         expected_archive_file_name = Path('archive.zip')
-        mock_zip_file = MagicMock(spec=zipfile.ZipFile)
-        with patch.object(zipfile, 'ZipFile') as mock_zip_file_cls:
-            mock_zip_file_cls.return_value.__enter__.return_value = mock_zip_file
+        mock_zip_file = _FakeZipFile()
+        with patch.object(zipfile, 'ZipFile', return_value=mock_zip_file) as mock_zip_file_cls:
             write_archive(expected_archive_file_name, [])
             mock_zip_file_cls.assert_called_once_with(
                 expected_archive_file_name, 'w',
                 compression=zipfile.ZIP_DEFLATED,
-                compresslevel=9)
-            mock_zip_file.write.assert_not_called()
+                compresslevel=6)
+            mock_zip_file.open.assert_not_called()
 
     def test_write_non_empty_archive(self):
         expected_archive_file_name = Path('archive.zip')
@@ -50,15 +111,57 @@ class TestWriteArchive(TestCase):
             ArchiveMapping(source_file_name=Path('source/a'), archive_file_name=Path('archive/a')),
             ArchiveMapping(source_file_name=Path('source/b'), archive_file_name=Path('archive/b')),
         ]
-        mock_zip_file = MagicMock(spec=zipfile.ZipFile)
-        with patch.object(zipfile, 'ZipFile') as mock_zip_file_cls:
-            mock_zip_file_cls.return_value.__enter__.return_value = mock_zip_file
+        mock_zip_file = _FakeZipFile()
+        with patch.object(zipfile, 'ZipFile', return_value=mock_zip_file) as mock_zip_file_cls, \
+             patch.object(zipfile.ZipInfo, 'from_file') as mock_from_file, \
+             patch('drover.io.open', mock_open()) as mock_source_open, \
+             patch.object(shutil, 'copyfileobj') as mock_copyfileobj:
             write_archive(expected_archive_file_name, expected_archive_mappings)
             mock_zip_file_cls.assert_called_once_with(
                 expected_archive_file_name, 'w',
                 compression=zipfile.ZIP_DEFLATED,
-                compresslevel=9)
+                compresslevel=6)
         for expected_archive_mapping in expected_archive_mappings:
-            mock_zip_file.write.assert_any_call(
-                filename=expected_archive_mapping.source_file_name,
+            mock_from_file.assert_any_call(
+                expected_archive_mapping.source_file_name,
                 arcname=expected_archive_mapping.archive_file_name)
+            mock_source_open.assert_any_call(expected_archive_mapping.source_file_name, 'rb')
+        expected_archive_info = mock_from_file.return_value
+        assert expected_archive_info.compress_type == zipfile.ZIP_DEFLATED
+        assert expected_archive_info._compresslevel == 6
+        assert mock_zip_file.open.call_count == len(expected_archive_mappings)
+        mock_zip_file.open.assert_called_with(expected_archive_info, 'w')
+        mock_copyfileobj.assert_called_with(
+            mock_source_open.return_value,
+            mock_zip_file.open.return_value.__enter__.return_value,
+            1 << 20)
+
+    def test_write_archive_contents(self):
+        with tempfile.TemporaryDirectory() as source_path:
+            source_path = Path(source_path)
+            source_file_name = source_path / 'a'
+            source_file_name.write_bytes(b'data' * 1024)
+            source_file_name.chmod(0o755)
+            archive_file_name = source_path / 'archive.zip'
+            write_archive(archive_file_name, [
+                ArchiveMapping(source_file_name=source_file_name, archive_file_name=Path('archive/a'))])
+            with zipfile.ZipFile(archive_file_name) as archive:
+                archive_info = archive.getinfo('archive/a')
+                assert archive_info.compress_type == zipfile.ZIP_DEFLATED
+                assert archive_info.external_attr >> 16 & 0o777 == 0o755
+                assert archive.read(archive_info) == b'data' * 1024
+
+    def test_write_archive_compression_level(self):
+        with tempfile.TemporaryDirectory() as source_path:
+            source_path = Path(source_path)
+            source_file_name = source_path / 'a'
+            source_file_name.write_bytes(b'data' * 1024)
+            archive_mappings = [
+                ArchiveMapping(source_file_name=source_file_name, archive_file_name=Path('a'))]
+            compress_sizes = []
+            for compresslevel in (0, 9):
+                archive_file_name = source_path / f'archive-{compresslevel}.zip'
+                write_archive(archive_file_name, archive_mappings, compresslevel=compresslevel)
+                with zipfile.ZipFile(archive_file_name) as archive:
+                    compress_sizes.append(archive.getinfo('a').compress_size)
+            assert compress_sizes[0] > compress_sizes[1]